@@ -21,6 +21,11 @@ from omegaconf import DictConfig, OmegaConf, open_dict
 
 from rlinf.utils.logging import get_logger
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 SUPPORTED_ENV_WRAPPERS = ("rgb", "default", "rgb_lowres", "rich_obs")
 
 R1PRO_PROPRIO_KEYS = [
@@ -218,7 +223,7 @@ def setup_omni_cfg(cfg: DictConfig) -> DictConfig:
     override_cfg = OmegaConf.select(cfg, "omni_config")
     cfg_path = os.path.join(og.example_config_path, f"{base_config_name}.yaml")
     with open(cfg_path, "r", encoding="utf-8") as f:
-        omni_cfg = OmegaConf.create(yaml.load(f, Loader=yaml.FullLoader))
+        omni_cfg = OmegaConf.create(yaml.load(f, Loader=_YamlLoader))
     # override env/render/camera/robots/task/scene config
     override_sub_cfg(omni_cfg, override_cfg, "env")
     override_sub_cfg(omni_cfg, override_cfg, "render")
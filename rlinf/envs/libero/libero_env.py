@@ -131,12 +131,17 @@ class LiberoEnv(gym.Env):
         self.ignore_terminations = cfg.ignore_terminations
         self.auto_reset = cfg.auto_reset
         self.is_eval = cfg.get("is_eval", False)
+        # Training resets rebuild every env by default; when disabled, envs
+        # whose task is unchanged are only reseeded and restored to their
+        # init state, like in evaluation.
+        self.rebuild_on_train_reset = cfg.get("rebuild_on_train_reset", True)
 
         self._generator = np.random.default_rng(seed=self.seed)
         self._generator_ordered = np.random.default_rng(seed=0)
         self.start_idx = 0
 
         self.task_suite: Benchmark = get_benchmark_overridden(cfg.task_suite_name)()
+        self._task_init_states: dict[int, np.ndarray] = {}
 
         self._compute_total_num_group_envs()
         self.reset_state_ids_all = self.get_reset_state_ids_all()
@@ -424,7 +429,7 @@ class LiberoEnv(gym.Env):
         self.total_num_group_envs = 0
         self.trial_id_bins = []
         for task_id in range(self.task_suite.get_num_tasks()):
-            task_num_trials = len(self.task_suite.get_task_init_states(task_id))
+            task_num_trials = len(self._get_task_init_states(task_id))
             self.trial_id_bins.append(task_num_trials)
             self.total_num_group_envs += task_num_trials
         self.cumsum_trial_id_bins = np.cumsum(self.trial_id_bins)
@@ -555,13 +560,21 @@ class LiberoEnv(gym.Env):
 
         return np.array(task_ids), np.array(trial_ids)
 
+    def _get_task_init_states(self, task_id):
+        # get_task_init_states() torch.loads the task's init file on every
+        # call, so keep each task's states once they have been loaded.
+        task_id = int(task_id)
+        if task_id not in self._task_init_states:
+            self._task_init_states[task_id] = self.task_suite.get_task_init_states(
+                task_id
+            )
+        return self._task_init_states[task_id]
+
     def _get_reset_states(self, env_idx):
         if env_idx is None:
             env_idx = np.arange(self.num_envs)
         init_state = [
-            self.task_suite.get_task_init_states(self.task_ids[env_id])[
-                self.trial_ids[env_id]
-            ]
+            self._get_task_init_states(self.task_ids[env_id])[self.trial_ids[env_id]]
             for env_id in env_idx
         ]
         return init_state
@@ -657,19 +670,11 @@ class LiberoEnv(gym.Env):
             list_of_dict_to_dict_of_list(images_and_states_list)
         )
 
-        full_image_tensor = torch.stack(
-            [value.clone() for value in images_and_states["full_image"]]
-        )
-        wrist_image_tensor = torch.stack(
-            [value.clone() for value in images_and_states["wrist_image"]]
-        )
-
-        states = images_and_states["state"]
-
+        # to_tensor already packs each field into a fresh batched tensor.
         obs = {
-            "main_images": full_image_tensor,
-            "wrist_images": wrist_image_tensor,
-            "states": states,
+            "main_images": images_and_states["full_image"],
+            "wrist_images": images_and_states["wrist_image"],
+            "states": images_and_states["state"],
             "task_descriptions": self.task_descriptions,
         }
         return obs
@@ -679,11 +684,12 @@ class LiberoEnv(gym.Env):
         task_ids, trial_ids = self._get_task_and_trial_ids_from_reset_state_ids(
             reset_state_ids
         )
+        rebuild = not self.is_eval and self.rebuild_on_train_reset
         for j, env_id in enumerate(env_idx):
             task_changed = self.task_ids[env_id] != task_ids[j]
             self.task_ids[env_id] = task_ids[j]
             self.trial_ids[env_id] = trial_ids[j]
-            if task_changed or not self.is_eval:
+            if task_changed or rebuild:
                 reconfig_env_idx.append(env_id)
         if reconfig_env_idx:
             env_fn_params = self.get_env_fn_params(reconfig_env_idx)
@@ -243,7 +243,11 @@ class DualFrankaEnv(gym.Env):
         start_x = (w - crop_size) // 2
         start_y = (h - crop_size) // 2
         cropped = frame[start_y : start_y + crop_size, start_x : start_x + crop_size]
-        resized = cv2.resize(cropped, reshape_size)
+        if cropped.shape[1::-1] == tuple(reshape_size):
+            # Already at the target resolution; cv2.resize would only copy.
+            resized = cropped
+        else:
+            resized = cv2.resize(cropped, reshape_size)
         return cropped, resized
 
     def _get_camera_frames(self) -> dict[str, np.ndarray]:
@@ -273,7 +277,12 @@ class DualFrankaEnv(gym.Env):
 
             reshape_size = self.observation_space["frames"][name].shape[:2][::-1]
             cropped, resized = self._crop_frame(frame, reshape_size)
-            frames[name] = resized[..., ::-1]
+            # cvtColor only handles 3 channels; colour+depth frames keep the
+            # slice so their depth channel is not dropped.
+            if resized.shape[-1] == 3:
+                frames[name] = cv2.cvtColor(resized, cv2.COLOR_RGB2BGR)
+            else:
+                frames[name] = resized[..., ::-1]
             display_frames[name] = resized
             display_frames[f"{name}_full"] = cropped
             self._last_camera_frame[name] = frame
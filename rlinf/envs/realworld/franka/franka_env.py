@@ -744,7 +744,11 @@ class FrankaEnv(gym.Env):
             cropped_frame = frame[
                 start_y : start_y + crop_size, start_x : start_x + crop_size
             ]
-        resized_frame = cv2.resize(cropped_frame, reshape_size)
+        if cropped_frame.shape[1::-1] == tuple(reshape_size):
+            # Already at the target resolution; cv2.resize would only copy.
+            resized_frame = cropped_frame
+        else:
+            resized_frame = cv2.resize(cropped_frame, reshape_size)
         return cropped_frame, resized_frame
 
     def _get_camera_frames(self) -> dict[str, np.ndarray]:
@@ -762,9 +766,16 @@ class FrankaEnv(gym.Env):
                     reshape_size,
                     crop_region=camera._camera_info.crop_region,
                 )
-                frames[camera._camera_info.name] = resized_frame[
-                    ..., ::-1
-                ]  # Convert RGB to BGR
+                # Convert RGB to BGR; cvtColor yields a contiguous array,
+                # unlike the negative-stride view from ``[..., ::-1]``. It
+                # only handles 3 channels, so colour+depth frames keep the
+                # slice and their depth channel.
+                if resized_frame.shape[-1] == 3:
+                    frames[camera._camera_info.name] = cv2.cvtColor(
+                        resized_frame, cv2.COLOR_RGB2BGR
+                    )
+                else:
+                    frames[camera._camera_info.name] = resized_frame[..., ::-1]
                 display_frames[camera._camera_info.name] = (
                     resized_frame  # Original RGB for display
                 )
@@ -12,7 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import json
 import os
 from typing import Optional, Union
 
@@ -23,8 +22,11 @@ import torch.multiprocessing as mp
 from omegaconf import OmegaConf
 from PIL import Image
 
-from rlinf.envs.robotwin.seed_utils import partition_success_seeds
-from rlinf.envs.utils import center_crop_image, list_of_dict_to_dict_of_list
+from rlinf.envs.robotwin.seed_utils import (
+    load_success_seeds,
+    partition_success_seeds,
+)
+from rlinf.envs.utils import center_crop_images, list_of_dict_to_dict_of_list
 
 __all__ = ["RoboTwinEnv"]
 
@@ -64,6 +66,8 @@ class RoboTwinEnv(gym.Env):
         self.task_name = cfg.task_config.task_name
 
         self.center_crop = cfg.get("center_crop", False)
+        # Resolved once: ``device`` is read several times per step.
+        self._device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
         self._init_reset_state_ids()
 
         self._init_env()
@@ -93,7 +97,7 @@ class RoboTwinEnv(gym.Env):
 
     @property
     def device(self):
-        return torch.device("cuda" if torch.cuda.is_available() else "cpu")
+        return self._device
 
     @property
     def elapsed_steps(self):
@@ -152,49 +156,56 @@ class RoboTwinEnv(gym.Env):
         infos["episode"] = episode_info
         return infos
 
-    def center_and_crop(self, image, center_crop=False):
-        image = np.array(image)
-
-        image = Image.fromarray(image).convert("RGB")
-        if center_crop:
-            image = center_crop_image(image)
-        return np.array(image)
+    def _to_rgb(self, image):
+        image = np.asarray(image)
+        # Frames from the vector env are already uint8 RGB, in which case the
+        # PIL round-trip would only copy the pixels twice.
+        if not (image.dtype == np.uint8 and image.ndim == 3 and image.shape[-1] == 3):
+            image = np.array(Image.fromarray(image).convert("RGB"))
+        return image
 
     def _extract_obs_image(self, raw_obs):
         batch_images = []
         batch_wrist_images = []
+        wrist_counts = []
         batch_states = []
         batch_instructions = []
         for obs in raw_obs:
-            batch_images.append(
-                self.center_and_crop(obs["full_image"], center_crop=self.center_crop)
-            )
+            batch_images.append(self._to_rgb(obs["full_image"]))
             wrist_images = []
             if "left_wrist_image" in obs and obs["left_wrist_image"] is not None:
-                wrist_images.append(
-                    self.center_and_crop(
-                        obs["left_wrist_image"], center_crop=self.center_crop
-                    )
-                )
+                wrist_images.append(self._to_rgb(obs["left_wrist_image"]))
             if "right_wrist_image" in obs and obs["right_wrist_image"] is not None:
-                wrist_images.append(
-                    self.center_and_crop(
-                        obs["right_wrist_image"], center_crop=self.center_crop
-                    )
-                )
-            if len(wrist_images) > 0:
-                batch_wrist_images.append(
-                    torch.stack([torch.from_numpy(img) for img in wrist_images])
-                )
+                wrist_images.append(self._to_rgb(obs["right_wrist_image"]))
+            # Keep wrist frames flat so they are packed with a single copy.
+            wrist_counts.append(len(wrist_images))
+            batch_wrist_images.extend(wrist_images)
             batch_states.append(obs["state"])
             batch_instructions.append(obs["instruction"])
 
-        batch_images = torch.stack([torch.from_numpy(img) for img in batch_images])
+        # Crop the whole batch in one call rather than once per image.
+        batch_images = np.stack(batch_images)
+        if self.center_crop:
+            batch_images = center_crop_images(batch_images)
+        batch_images = torch.from_numpy(batch_images)
         if len(batch_wrist_images) > 0:
-            batch_wrist_images = torch.stack(batch_wrist_images)
+            # The flat frames are regrouped per env below, which is only
+            # valid if every env reported the same number of wrist images.
+            num_wrist = wrist_counts[0]
+            assert all(count == num_wrist for count in wrist_counts), (
+                f"Every env must report the same number of wrist images, "
+                f"got {wrist_counts}"
+            )
+            batch_wrist_images = np.stack(batch_wrist_images)
+            if self.center_crop:
+                batch_wrist_images = center_crop_images(batch_wrist_images)
+            batch_wrist_images = torch.from_numpy(batch_wrist_images).unflatten(
+                0, (-1, num_wrist)
+            )
         else:
             batch_wrist_images = None
-        batch_states = torch.stack([torch.from_numpy(state) for state in batch_states])
+        # One tensor for the whole batch instead of one per env.
+        batch_states = torch.from_numpy(np.stack(batch_states))
 
         extracted_obs = {
             "main_images": batch_images,
@@ -217,25 +228,16 @@ class RoboTwinEnv(gym.Env):
             return reward
 
     def _cal_chunk_rewards(self, step_reward, chunk_step, terminations, infos):
-        n_steps_to_run = np.array(
-            [[0] for i in range(self.num_envs)]
-        )  # infos.get("n_steps_to_run", np.array([[0] for i in range(self.num_envs)]))
-
-        n_steps_to_run = torch.as_tensor(
-            np.array(n_steps_to_run).reshape(-1), device=self.device
-        )
+        # The vector env does not report ``n_steps_to_run``, so every env runs
+        # the whole chunk and the reward always lands on the last step.
         chunk_rewards = torch.zeros(self.num_envs, chunk_step, device=self.device)
-        for env_id in range(self.num_envs):
-            steps_left = n_steps_to_run[env_id]
-            reward = step_reward[env_id]
-            start_idx = chunk_step - steps_left - 1
-
-            if terminations[env_id] and start_idx > 0:
-                if self.use_rel_reward:
-                    chunk_rewards[env_id, start_idx] = reward
-                else:
-                    chunk_rewards[env_id, start_idx:] = reward
-
+        if chunk_step > 1:
+            # Flatten so (num_envs, 1) inputs do not broadcast to a matrix.
+            terminations = torch.as_tensor(terminations, device=self.device).reshape(-1)
+            step_reward = torch.as_tensor(step_reward, device=self.device).reshape(-1)
+            chunk_rewards[:, -1] = torch.where(
+                terminations.bool(), step_reward, chunk_rewards[:, -1]
+            )
         return chunk_rewards
 
     def reset(
@@ -418,11 +420,8 @@ class RoboTwinEnv(gym.Env):
         if self.cfg.get("seeds_path", None) is not None and os.path.exists(
             self.cfg.seeds_path
         ):
-            with open(self.cfg.seeds_path, "r") as f:
-                data = json.load(f)
-            success_seeds = data[self.task_name].get("success_seeds", None)
+            success_seeds = load_success_seeds(self.cfg.seeds_path, self.task_name)
             if success_seeds is not None:
-                success_seeds = torch.as_tensor(success_seeds, dtype=torch.long)
                 self.success_seeds = partition_success_seeds(
                     success_seeds,
                     base_seed=self.base_seed,
@@ -12,9 +12,37 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
+import json
+import os
+from typing import Optional
+
 import torch
 
 
+@functools.lru_cache(maxsize=8)
+def _load_seeds_file(path: str, mtime_ns: int, size: int) -> dict:
+    # mtime and size are only part of the cache key, so an edited file is
+    # parsed again instead of being served stale.
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def load_success_seeds(seeds_path: str, task_name: str) -> Optional[torch.Tensor]:
+    """Return the success seeds recorded for ``task_name``, or None if absent.
+
+    The parsed seeds file is cached per process, so the train and eval envs
+    of a worker that share one file only parse it once.
+    """
+    path = os.path.abspath(seeds_path)
+    stat = os.stat(path)
+    data = _load_seeds_file(path, stat.st_mtime_ns, stat.st_size)
+    success_seeds = data[task_name].get("success_seeds", None)
+    if success_seeds is None:
+        return None
+    return torch.as_tensor(success_seeds, dtype=torch.long)
+
+
 def partition_success_seeds(
     success_seeds: torch.Tensor,
     *,
@@ -20,6 +20,9 @@ import torch
 from PIL import Image, ImageDraw, ImageFont
 
 _tf = None
+_fonts: dict[Optional[int], Any] = {}
+_TEXT_MASK_CACHE_SIZE = 4096
+_text_masks: dict[str, tuple[np.ndarray, int, int, int]] = {}
 
 
 def _get_tensorflow():
@@ -33,6 +36,16 @@ def _get_tensorflow():
     return _tf
 
 
+def _get_default_font(size: Optional[int] = None):
+    # load_default() parses the font from scratch, so reuse it across frames.
+    if size not in _fonts:
+        if size is None:
+            _fonts[size] = ImageFont.load_default()
+        else:
+            _fonts[size] = ImageFont.load_default(size=size)
+    return _fonts[size]
+
+
 def get_env_attr(env, name: str, default: Any = None) -> Any:
     """Fetch an attribute from a (possibly wrapped) gym/gymnasium env.
 
@@ -100,8 +113,11 @@ def to_tensor(
             array = np.array(array)
             if array.dtype == object:
                 return [to_tensor(x, device=device) for x in array]
-
-        ret = torch.tensor(array, device=device)
+            # The stacked array is a fresh copy, so it can back the tensor
+            # directly instead of being copied a second time.
+            ret = torch.from_numpy(array).to(device)
+        else:
+            ret = torch.tensor(array, device=device)
 
     if ret.dtype == torch.float64:
         ret = ret.to(torch.float32)
@@ -185,6 +201,9 @@ def tile_images(
     batched = False
     if len(images[0].shape) == 4:
         batched = True
+    # Equally sized frames need no sorting or column packing.
+    if all(im.shape == images[0].shape for im in images):
+        return _tile_equal_images(images, nrows, batched)
     if nrows == 1:
         images = sorted(images, key=lambda x: x.shape[0 + batched], reverse=True)
 
@@ -224,20 +243,45 @@ def tile_images(
         output_image = torch.zeros(output_shape, dtype=images[0].dtype)
     else:
         output_image = np.zeros(output_shape, dtype=images[0].dtype)
+    # Copy every image straight into its slot rather than concatenating
+    # each column first.
     cur_x = 0
     for column in columns:
         cur_w = column[0].shape[1 + batched]
         next_x = cur_x + cur_w
-        if is_torch:
-            column_image = torch.concatenate(column, dim=0 + batched)
-        else:
-            column_image = np.concatenate(column, axis=0 + batched)
-        cur_h = column_image.shape[0 + batched]
-        output_image[..., :cur_h, cur_x:next_x, :] = column_image
+        cur_y = 0
+        for im in column:
+            next_y = cur_y + im.shape[0 + batched]
+            output_image[..., cur_y:next_y, cur_x:next_x, :] = im
+            cur_y = next_y
         cur_x = next_x
     return output_image
 
 
+def _tile_equal_images(
+    images: list[Union[np.ndarray, torch.Tensor]], nrows: int, batched: bool
+) -> Union[np.ndarray, torch.Tensor]:
+    """Fast path of :func:`tile_images` for equally shaped frames.
+
+    Produces the same column-major layout, but blits every frame straight
+    into a preallocated canvas instead of packing columns first.
+    """
+    height, width = images[0].shape[batched : 2 + batched]
+    ncols = -(-len(images) // nrows)
+    output_shape = (height * nrows, width * ncols, 3)
+    if batched:
+        output_shape = (images[0].shape[0],) + output_shape
+    if isinstance(images[0], torch.Tensor):
+        output_image = torch.zeros(output_shape, dtype=images[0].dtype)
+    else:
+        output_image = np.zeros(output_shape, dtype=images[0].dtype)
+    for i, im in enumerate(images):
+        col, row = divmod(i, nrows)
+        y, x = row * height, col * width
+        output_image[..., y : y + height, x : x + width, :] = im
+    return output_image
+
+
 def put_text_on_image(
     image: np.ndarray, lines: list[str], max_width: int = 200
 ) -> np.ndarray:
@@ -251,35 +295,89 @@ def put_text_on_image(
     """
     assert image.dtype == np.uint8, image.dtype
     image = image.copy()
-    image = Image.fromarray(image)
-    draw = ImageDraw.Draw(image)
-    font = ImageFont.load_default(size=20)
+    if not lines:
+        return image
+    font = _get_default_font(size=20)
 
+    # Measure each word once and keep a running line width instead of
+    # re-measuring the whole line every time a word is added.
+    space_width = font.getlength(" ")
     new_lines = []
     for line in lines:
         words = line.split()
         current_line = []
+        current_width = 0.0
 
         for word in words:
-            test_line = " ".join(current_line + [word])
-            test_width = font.getlength(test_line)
+            word_width = font.getlength(word)
+            test_width = word_width
+            if current_line:
+                test_width += current_width + space_width
 
             if test_width <= max_width:
                 current_line.append(word)
+                current_width = test_width
             else:
                 new_lines.append(" ".join(current_line))
                 current_line = [word]
+                current_width = word_width
         if current_line:
             new_lines.append(" ".join(current_line))
 
+    # RGB frames get the cached text masks blended in directly; other layouts
+    # (e.g. RGBA) are still drawn through PIL, which composites them itself.
+    is_rgb = image.ndim == 3 and image.shape[-1] == 3
+    if not is_rgb:
+        pil_image = Image.fromarray(image)
+        draw = ImageDraw.Draw(pil_image)
+
     y = -10
     for line in new_lines:
-        bbox = draw.textbbox((0, 0), text=line)
-        textheight = bbox[3] - bbox[1]
+        mask, left, top, textheight = _get_text_mask(line)
         y += textheight + 10
         x = 10
-        draw.text((x, y), text=line, fill=(0, 0, 0))
-    return np.array(image)
+        if is_rgb:
+            _blend_text_mask(image, mask, x + left, y + top)
+        else:
+            draw.text((x, y), text=line, fill=(0, 0, 0), font=_get_default_font())
+    return image if is_rgb else np.array(pil_image)
+
+
+def _get_text_mask(line: str) -> tuple[np.ndarray, int, int, int]:
+    """Render ``line`` once with the default font and cache its coverage mask.
+
+    Returns the mask, its offset from the text origin and the line height
+    used for layout.
+    """
+    cached = _text_masks.get(line)
+    if cached is None:
+        text_font = _get_default_font()
+        left, top, right, bottom = text_font.getbbox(line)
+        mask = Image.new("L", (max(right - left, 0), max(bottom - top, 0)))
+        ImageDraw.Draw(mask).text((-left, -top), line, fill=255, font=text_font)
+        if len(_text_masks) >= _TEXT_MASK_CACHE_SIZE:
+            _text_masks.clear()
+        cached = (np.array(mask), left, top, bottom - top)
+        _text_masks[line] = cached
+    return cached
+
+
+def _blend_text_mask(image: np.ndarray, mask: np.ndarray, x: int, y: int) -> None:
+    """Blend black text into an RGB ``image`` through ``mask`` at (x, y), in place.
+
+    Uses the same rounding as PIL's bitmap drawing, so the result matches
+    drawing the text with ``ImageDraw`` pixel for pixel.
+    """
+    height, width = image.shape[:2]
+    y0, x0 = max(y, 0), max(x, 0)
+    y1 = min(y + mask.shape[0], height)
+    x1 = min(x + mask.shape[1], width)
+    if y0 >= y1 or x0 >= x1:
+        return
+    alpha = mask[y0 - y : y1 - y, x0 - x : x1 - x, None].astype(np.uint32)
+    region = image[y0:y1, x0:x1]
+    blended = region * (255 - alpha) + 128
+    region[...] = ((blended >> 8) + blended) >> 8
 
 
 def put_info_on_image(
@@ -350,19 +448,36 @@ def crop_and_resize(image, crop_scale, batch_size):
 
 
 def center_crop_image(image):
-    tf = _get_tensorflow()
+    image = center_crop_images(np.array(image)[None])[0]
 
-    batch_size = 1
-    crop_scale = 0.9
+    image = Image.fromarray(image)
+    image = image.convert("RGB")
+    return image
 
-    image = tf.convert_to_tensor(np.array(image))
-    orig_dtype = image.dtype
 
-    image = tf.image.convert_image_dtype(image, tf.float32)
-    image = crop_and_resize(image, crop_scale, batch_size)
-    image = tf.clip_by_value(image, 0, 1)
-    image = tf.image.convert_image_dtype(image, orig_dtype, saturate=True)
+def center_crop_images(images: np.ndarray) -> np.ndarray:
+    """
+    Batched version of :func:`center_crop_image`.
 
-    image = Image.fromarray(image.numpy())
-    image = image.convert("RGB")
-    return image
+    All frames go through a single ``crop_and_resize`` call instead of one
+    TensorFlow round-trip per image.
+
+    Args:
+        images: Batch of images of shape (B, H, W, C)
+
+    Returns:
+        Cropped images of shape (B, 224, 224, C) with the input dtype
+    """
+    tf = _get_tensorflow()
+
+    batch_size = images.shape[0]
+    crop_scale = np.full((batch_size,), 0.9, dtype=np.float32)
+
+    images = tf.convert_to_tensor(images)
+    orig_dtype = images.dtype
+
+    images = tf.image.convert_image_dtype(images, tf.float32)
+    images = crop_and_resize(images, crop_scale, batch_size)
+    images = tf.clip_by_value(images, 0, 1)
+    images = tf.image.convert_image_dtype(images, orig_dtype, saturate=True)
+    return images.numpy()
@@ -174,27 +174,17 @@ class RecordVideo(gym.Wrapper):
         if img.ndim == 4:
             if img.shape[1] in (1, 3, 4) and img.shape[-1] not in (1, 3, 4):
                 img = np.transpose(img, (0, 2, 3, 1))
-            images = []
-            for i in range(img.shape[0]):
-                single = img[i]
-                if single.dtype != np.uint8:
-                    single = single.astype(np.uint8)
-                images.append(single)
-            return [images]
+            # Cast the whole batch once; the per-env frames are views into it.
+            if img.dtype != np.uint8:
+                img = img.astype(np.uint8)
+            return [list(img)]
 
         if img.ndim == 5:
             if img.shape[2] in (1, 3, 4) and img.shape[-1] not in (1, 3, 4):
                 img = np.transpose(img, (0, 1, 3, 4, 2))
-            frames = []
-            for t in range(img.shape[1]):
-                images = []
-                for i in range(img.shape[0]):
-                    single = img[i, t]
-                    if single.dtype != np.uint8:
-                        single = single.astype(np.uint8)
-                    images.append(single)
-                frames.append(images)
-            return frames
+            if img.dtype != np.uint8:
+                img = img.astype(np.uint8)
+            return [list(img[:, t]) for t in range(img.shape[1])]
 
         return []
 
@@ -0,0 +1,139 @@
+# Copyright 2026 The RLinf Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pytest
+import torch
+from PIL import Image, ImageDraw, ImageFont
+
+from rlinf.envs.utils import put_text_on_image, tile_images
+
+
+def _random_frames(num_images: int, height: int = 6, width: int = 5):
+    rng = np.random.default_rng(0)
+    return [
+        rng.integers(0, 255, size=(height, width, 3), dtype=np.uint8)
+        for _ in range(num_images)
+    ]
+
+
+@pytest.mark.parametrize(
+    ("num_images", "nrows"), [(1, 1), (4, 1), (4, 2), (5, 2), (9, 3)]
+)
+def test_tile_images_equal_frames_layout(num_images: int, nrows: int):
+    images = _random_frames(num_images)
+    tiled = tile_images(images, nrows=nrows)
+
+    ncols = -(-num_images // nrows)
+    assert tiled.shape == (6 * nrows, 5 * ncols, 3)
+    assert tiled.dtype == np.uint8
+    for i, image in enumerate(images):
+        col, row = divmod(i, nrows)
+        np.testing.assert_array_equal(
+            tiled[row * 6 : (row + 1) * 6, col * 5 : (col + 1) * 5], image
+        )
+    # Unused cells of the last column stay black.
+    if num_images % nrows:
+        assert not tiled[(num_images % nrows) * 6 :, -5:].any()
+
+
+def test_tile_images_mixed_heights_single_row():
+    images = _random_frames(1, height=4) + _random_frames(1, height=6)
+    tiled = tile_images(images, nrows=1)
+
+    assert tiled.shape == (6, 10, 3)
+    np.testing.assert_array_equal(tiled[:, :5], images[1])
+    np.testing.assert_array_equal(tiled[:4, 5:], images[0])
+    assert not tiled[4:, 5:].any()
+
+
+def test_tile_images_batched_torch_frames():
+    images = [torch.from_numpy(np.stack(_random_frames(2))) for _ in range(3)]
+    tiled = tile_images(images, nrows=2)
+
+    assert isinstance(tiled, torch.Tensor)
+    assert tiled.shape == (2, 12, 10, 3)
+    torch.testing.assert_close(tiled[:, :6, :5], images[0])
+    torch.testing.assert_close(tiled[:, 6:, :5], images[1])
+    torch.testing.assert_close(tiled[:, :6, 5:], images[2])
+    assert not tiled[:, 6:, 5:].any()
+
+
+def _wrap_lines_by_prefix(lines: list[str], max_width: int) -> list[str]:
+    """Reference wrapping that re-measures the whole prefix for every word."""
+    font = ImageFont.load_default(size=20)
+    new_lines = []
+    for line in lines:
+        current_line = []
+        for word in line.split():
+            if font.getlength(" ".join(current_line + [word])) <= max_width:
+                current_line.append(word)
+            else:
+                new_lines.append(" ".join(current_line))
+                current_line = [word]
+        if current_line:
+            new_lines.append(" ".join(current_line))
+    return new_lines
+
+
+def _draw_text_with_pil(image: np.ndarray, lines: list[str]) -> np.ndarray:
+    pil_image = Image.fromarray(image)
+    draw = ImageDraw.Draw(pil_image)
+    font = ImageFont.load_default()
+    y = -10
+    for line in lines:
+        bbox = draw.textbbox((0, 0), text=line, font=font)
+        y += bbox[3] - bbox[1] + 10
+        draw.text((10, y), text=line, fill=(0, 0, 0), font=font)
+    return np.array(pil_image)
+
+
+@pytest.mark.parametrize("shape", [(96, 128, 3), (20, 30, 3), (96, 128, 4)])
+def test_put_text_on_image_matches_pil_drawing(shape):
+    rng = np.random.default_rng(0)
+    image = rng.integers(0, 256, size=shape, dtype=np.uint8)
+    original = image.copy()
+    lines = ["reward: 0.125", "success: True", "jQy_g-7"]
+
+    # Lines are short enough not to wrap at the default max_width.
+    result = put_text_on_image(image, lines)
+
+    np.testing.assert_array_equal(result, _draw_text_with_pil(image, lines))
+    np.testing.assert_array_equal(image, original)
+    # Drawn twice so the second call goes through the cached text masks.
+    np.testing.assert_array_equal(put_text_on_image(image, lines), result)
+
+
+@pytest.mark.parametrize(
+    ("lines", "max_width"),
+    [
+        (["episode_len: 12 reward: 0.125 success: True terminations: False"], 200),
+        (["a bb ccc dddd eeeee ffffff ggggggg hhhhhhhh", "short"], 60),
+        # A single word wider than max_width, first on its line and mid-line.
+        (["supercalifragilisticexpialidocious"], 50),
+        (["ok supercalifragilisticexpialidocious ok"], 50),
+        (["two  spaces\tand tabs   between   words"], 80),
+    ],
+)
+def test_put_text_on_image_wraps_like_prefix_measurement(lines, max_width):
+    rng = np.random.default_rng(1)
+    image = rng.integers(0, 256, size=(160, 320, 3), dtype=np.uint8)
+
+    wrapped = _wrap_lines_by_prefix(lines, max_width)
+    assert len(wrapped) > len(lines)
+
+    np.testing.assert_array_equal(
+        put_text_on_image(image, lines, max_width=max_width),
+        _draw_text_with_pil(image, wrapped),
+    )
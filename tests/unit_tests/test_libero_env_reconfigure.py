@@ -0,0 +1,118 @@
+# Copyright 2026 The RLinf Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import importlib
+import sys
+import types
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+import pytest
+from omegaconf import OmegaConf
+
+
+class _FakeBenchmark:
+    pass
+
+
+def _load_libero_env_module(monkeypatch):
+    """Import libero_env against stub LIBERO and subprocess-env modules."""
+    monkeypatch.delenv("LIBERO_TYPE", raising=False)
+
+    libero_root = Path("/nonexistent/libero/libero")
+    fake_libero = types.ModuleType("libero")
+    fake_libero.__path__ = []
+    fake_libero_core = types.ModuleType("libero.libero")
+    fake_libero_core.__path__ = []
+    fake_libero_core.__file__ = str(libero_root / "__init__.py")
+    fake_libero_core.get_libero_path = lambda name: str(libero_root)
+    fake_libero_core.set_libero_default_path = lambda path: None
+    fake_benchmark = types.ModuleType("libero.libero.benchmark")
+    fake_benchmark.Benchmark = _FakeBenchmark
+    fake_benchmark.BENCHMARK_MAPPING = {}
+
+    fake_venv = types.ModuleType("rlinf.envs.libero.venv")
+    fake_venv.ReconfigureSubprocEnv = mock.MagicMock(name="ReconfigureSubprocEnv")
+
+    monkeypatch.setitem(sys.modules, "libero", fake_libero)
+    monkeypatch.setitem(sys.modules, "libero.libero", fake_libero_core)
+    monkeypatch.setitem(sys.modules, "libero.libero.benchmark", fake_benchmark)
+    monkeypatch.setitem(sys.modules, "rlinf.envs.libero.venv", fake_venv)
+    for name in ("rlinf.envs.libero.utils", "rlinf.envs.libero.libero_env"):
+        monkeypatch.delitem(sys.modules, name, raising=False)
+
+    module = importlib.import_module("rlinf.envs.libero.libero_env")
+    monkeypatch.setitem(sys.modules, module.__name__, module)
+    return module
+
+
+def _make_env(module, rebuild_on_train_reset):
+    env = object.__new__(module.LiberoEnv)
+    env.cfg = OmegaConf.create({"libero_variant": "standard"})
+    env.seed = 3
+    env.is_eval = False
+    env.rebuild_on_train_reset = rebuild_on_train_reset
+    # Two tasks with two init states each: reset_state_id = 2 * task + trial.
+    env.cumsum_trial_id_bins = np.array([2, 4])
+    env.task_ids = np.array([0, 1])
+    env.trial_ids = np.array([0, 0])
+    env.task_suite = mock.MagicMock()
+    env.task_suite.get_task_init_states.side_effect = lambda task_id: (
+        np.arange(2) + (10 * task_id)
+    )
+    env._task_init_states = {}
+    env.get_env_fn_params = mock.MagicMock(
+        side_effect=lambda env_idx: [f"params_{i}" for i in env_idx]
+    )
+    env.env = module.ReconfigureSubprocEnv([])
+    env.env.reset_mock()
+    return env
+
+
+def test_libero_train_reset_reuses_env_with_unchanged_task(monkeypatch):
+    module = _load_libero_env_module(monkeypatch)
+    env = _make_env(module, rebuild_on_train_reset=False)
+    env_idx = [0, 1]
+
+    # Env 0 stays on task 0 (trial 1); env 1 moves from task 1 to task 0.
+    env._reconfigure(np.array([1, 0]), env_idx)
+
+    env.get_env_fn_params.assert_called_once_with([1])
+    env.env.reconfigure_env_fns.assert_called_once_with(["params_1"], [1])
+    env.env.seed.assert_called_once_with(env.seed * len(env_idx))
+    env.env.reset.assert_called_once_with(id=env_idx)
+    env.env.set_init_state.assert_called_once_with(init_state=[1, 0], id=env_idx)
+    np.testing.assert_array_equal(env.task_ids, [0, 0])
+    np.testing.assert_array_equal(env.trial_ids, [1, 0])
+
+
+@pytest.mark.parametrize("rebuild_on_train_reset", [True, False])
+def test_libero_train_reset_rebuild_flag(monkeypatch, rebuild_on_train_reset):
+    module = _load_libero_env_module(monkeypatch)
+    env = _make_env(module, rebuild_on_train_reset=rebuild_on_train_reset)
+    env_idx = [0, 1]
+
+    # Neither env changes task.
+    env._reconfigure(np.array([1, 3]), env_idx)
+
+    if rebuild_on_train_reset:
+        env.env.reconfigure_env_fns.assert_called_once_with(
+            ["params_0", "params_1"], env_idx
+        )
+    else:
+        env.env.reconfigure_env_fns.assert_not_called()
+    env.env.seed.assert_called_once_with(env.seed * len(env_idx))
+    env.env.reset.assert_called_once_with(id=env_idx)
+    env.env.set_init_state.assert_called_once_with(init_state=[1, 11], id=env_idx)
@@ -0,0 +1,168 @@
+# Copyright 2026 The RLinf Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pytest
+import torch
+from PIL import Image
+
+from rlinf.envs.robotwin.robotwin_env import RoboTwinEnv
+from rlinf.envs.utils import center_crop_image, center_crop_images, crop_and_resize
+
+
+def _reference_center_crop(image):
+    """Per-image TensorFlow crop, as center_crop_image did before batching."""
+    tf = pytest.importorskip("tensorflow")
+
+    image = tf.convert_to_tensor(np.array(image))
+    orig_dtype = image.dtype
+    image = tf.image.convert_image_dtype(image, tf.float32)
+    image = crop_and_resize(image, 0.9, 1)
+    image = tf.clip_by_value(image, 0, 1)
+    image = tf.image.convert_image_dtype(image, orig_dtype, saturate=True)
+    return np.array(Image.fromarray(image.numpy()).convert("RGB"))
+
+
+def _make_env(center_crop, num_envs):
+    env = object.__new__(RoboTwinEnv)
+    env.center_crop = center_crop
+    env.num_envs = num_envs
+    env._device = torch.device("cpu")
+    return env
+
+
+def _make_raw_obs(num_envs, num_wrist, seed=0):
+    rng = np.random.default_rng(seed)
+    wrist_keys = ["left_wrist_image", "right_wrist_image"][:num_wrist]
+    raw_obs = []
+    for env_id in range(num_envs):
+        obs = {
+            "full_image": rng.integers(0, 256, (48, 64, 3), dtype=np.uint8),
+            "state": rng.standard_normal(14).astype(np.float32),
+            "instruction": f"task {env_id}",
+        }
+        for key in wrist_keys:
+            obs[key] = rng.integers(0, 256, (48, 64, 3), dtype=np.uint8)
+        raw_obs.append(obs)
+    return raw_obs
+
+
+def _reference_extract_obs_image(raw_obs, center_crop):
+    """Per-env, per-image extraction used before the batched crop."""
+
+    def process(image):
+        image = np.array(Image.fromarray(np.array(image)).convert("RGB"))
+        if center_crop:
+            image = _reference_center_crop(image)
+        return torch.from_numpy(image)
+
+    main_images = torch.stack([process(obs["full_image"]) for obs in raw_obs])
+    wrist_images = []
+    for obs in raw_obs:
+        frames = [
+            process(obs[key])
+            for key in ("left_wrist_image", "right_wrist_image")
+            if obs.get(key) is not None
+        ]
+        if len(frames) > 0:
+            wrist_images.append(torch.stack(frames))
+    wrist_images = torch.stack(wrist_images) if len(wrist_images) > 0 else None
+    states = torch.stack([torch.from_numpy(obs["state"]) for obs in raw_obs])
+    return main_images, wrist_images, states
+
+
+def test_center_crop_images_matches_per_image_crop():
+    pytest.importorskip("tensorflow")
+    rng = np.random.default_rng(0)
+    batch = rng.integers(0, 256, (3, 48, 64, 3), dtype=np.uint8)
+
+    cropped = center_crop_images(batch)
+
+    assert cropped.shape == (3, 224, 224, 3)
+    assert cropped.dtype == np.uint8
+    expected = np.stack([_reference_center_crop(image) for image in batch])
+    np.testing.assert_array_equal(cropped, expected)
+    np.testing.assert_array_equal(
+        cropped, np.stack([np.array(center_crop_image(image)) for image in batch])
+    )
+
+
+@pytest.mark.parametrize("center_crop", [False, True])
+@pytest.mark.parametrize("num_wrist", [0, 1, 2])
+def test_extract_obs_image_matches_per_image_path(center_crop, num_wrist):
+    if center_crop:
+        pytest.importorskip("tensorflow")
+    num_envs = 3
+    env = _make_env(center_crop, num_envs)
+    raw_obs = _make_raw_obs(num_envs, num_wrist)
+
+    extracted = env._extract_obs_image(raw_obs)
+
+    main_images, wrist_images, states = _reference_extract_obs_image(
+        raw_obs, center_crop
+    )
+    size = (224, 224) if center_crop else (48, 64)
+    assert extracted["main_images"].shape == (num_envs, *size, 3)
+    torch.testing.assert_close(extracted["main_images"], main_images)
+    if num_wrist == 0:
+        assert extracted["wrist_images"] is None
+        assert wrist_images is None
+    else:
+        assert extracted["wrist_images"].shape == (num_envs, num_wrist, *size, 3)
+        torch.testing.assert_close(extracted["wrist_images"], wrist_images)
+    torch.testing.assert_close(extracted["states"], states)
+    assert extracted["task_descriptions"] == [obs["instruction"] for obs in raw_obs]
+
+
+def test_extract_obs_image_rejects_mixed_wrist_counts():
+    env = _make_env(center_crop=False, num_envs=2)
+    raw_obs = _make_raw_obs(num_envs=2, num_wrist=2)
+    raw_obs[1]["right_wrist_image"] = None
+
+    with pytest.raises(AssertionError, match="same number of wrist images"):
+        env._extract_obs_image(raw_obs)
+
+
+def _reference_chunk_rewards(step_reward, chunk_step, terminations, use_rel_reward):
+    """Per-env loop used before the vectorized chunk reward."""
+    num_envs = len(terminations)
+    chunk_rewards = torch.zeros(num_envs, chunk_step)
+    start_idx = chunk_step - 1
+    for env_id in range(num_envs):
+        if terminations[env_id] and start_idx > 0:
+            if use_rel_reward:
+                chunk_rewards[env_id, start_idx] = step_reward[env_id]
+            else:
+                chunk_rewards[env_id, start_idx:] = step_reward[env_id]
+    return chunk_rewards
+
+
+@pytest.mark.parametrize("reward_shape", [(4,), (4, 1)])
+@pytest.mark.parametrize("use_rel_reward", [False, True])
+@pytest.mark.parametrize("chunk_step", [1, 3])
+def test_cal_chunk_rewards_matches_per_env_loop(
+    chunk_step, use_rel_reward, reward_shape
+):
+    env = _make_env(center_crop=False, num_envs=4)
+    env.use_rel_reward = use_rel_reward
+    step_reward = torch.tensor([0.5, -1.0, 2.0, 1.5]).reshape(reward_shape)
+    terminations = torch.tensor([True, False, True, False]).reshape(reward_shape)
+
+    chunk_rewards = env._cal_chunk_rewards(step_reward, chunk_step, terminations, {})
+
+    expected = _reference_chunk_rewards(
+        step_reward.reshape(-1), chunk_step, terminations.reshape(-1), use_rel_reward
+    )
+    assert chunk_rewards.shape == (4, chunk_step)
+    torch.testing.assert_close(chunk_rewards, expected)
@@ -12,10 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
+import os
+
 import pytest
 import torch
 
-from rlinf.envs.robotwin.seed_utils import partition_success_seeds
+from rlinf.envs.robotwin.seed_utils import load_success_seeds, partition_success_seeds
 
 
 def _first_eval_seeds(
@@ -91,3 +94,21 @@ def test_robotwin_eval_success_seed_order_is_controlled_by_base_seed():
 
     assert selected_seed_0 == selected_seed_0_again
     assert selected_seed_0 != selected_seed_1
+
+
+def test_robotwin_success_seeds_reload_after_file_changes(tmp_path):
+    seeds_path = tmp_path / "seeds.json"
+    seeds_path.write_text(json.dumps({"task": {"success_seeds": [3, 1, 2]}}))
+
+    seeds = load_success_seeds(str(seeds_path), "task")
+    assert seeds.tolist() == [3, 1, 2]
+    # Callers get their own tensor, so mutating it cannot leak into the cache.
+    seeds[0] = 100
+    assert load_success_seeds(str(seeds_path), "task").tolist() == [3, 1, 2]
+
+    seeds_path.write_text(
+        json.dumps({"task": {"success_seeds": [7, 8, 9, 10]}, "other_task": {}})
+    )
+    os.utime(seeds_path, ns=(0, 0))
+    assert load_success_seeds(str(seeds_path), "task").tolist() == [7, 8, 9, 10]
+    assert load_success_seeds(str(seeds_path), "other_task") is None